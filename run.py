@@ -1,10 +1,18 @@
 import time
 
+SCAN_INTERVAL_SECONDS = 10
+
 def run_forever():
     print("Scanner running...")
+    deadline = time.monotonic()
     while True:
+        deadline += SCAN_INTERVAL_SECONDS
         print("Still alive...")
-        time.sleep(10)
+        now = time.monotonic()
+        # Skip ticks we already missed instead of firing them back to back.
+        while deadline < now:
+            deadline += SCAN_INTERVAL_SECONDS
+        time.sleep(max(0.0, deadline - now))
 
 if __name__ == "__main__":
-    run_forever()
\ No newline at end of file
+    run_forever()